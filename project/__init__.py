@@ -1 +1,45 @@
-print("import sources directory")
+"""
+Homework sources of the Python course.
+
+Submodules are imported lazily on first attribute access, so
+``import project`` itself has no side effects and stays cheap.
+"""
+
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
+
+__all__ = [
+    "cache_decorator",
+    "curry",
+    "matrix",
+    "smart_args",
+    "vector",
+    "vector_index",
+]
+
+
+def __getattr__(name: str) -> ModuleType:
+    """
+    Import a submodule of the package on first use.
+
+    :param name: The name of the requested attribute
+    :return: The imported submodule
+    :raises AttributeError: If the name is not a known submodule
+    """
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{name}", __name__)
+    # Cache the module in globals so __getattr__ is not called again
+    globals()[name] = module
+    return module
+
+
+def __dir__() -> list[str]:
+    """
+    List the attributes of the package including lazily loaded submodules.
+
+    :return: Sorted list of attribute names
+    """
+    return sorted(set(globals()) | set(__all__))
@@ -1 +1,393 @@
-print("exec sources directory")
+"""
+Entry point for ``python -m project``.
+
+Batch runner for the matrix and vector operations of the package. Inputs are
+read from CSV files (one row per line) or raw little-endian float64 binary
+files, processed in row chunks and streamed to stdout or an output file.
+
+Examples:
+    python -m project multiply a.csv b.csv -o c.csv
+    python -m project norm vectors.bin --format bin --cols 128
+"""
+
+import argparse
+import csv
+import sys
+from array import array
+from itertools import islice, zip_longest
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from project.matrix import matrix_addition, matrix_multiplication, matrix_transpose
+from project.vector import angle, dot_product, vector_length
+
+Row = List[float]
+T = TypeVar("T")
+
+FLOAT_SIZE = array("d").itemsize
+DEFAULT_CHUNK_ROWS = 1024
+
+# Operations that take two inputs
+BINARY_OPERATIONS = ("multiply", "add", "dot", "angle")
+OPERATIONS = BINARY_OPERATIONS + ("transpose", "norm")
+
+
+def read_csv_rows(stream: IO[str]) -> Iterator[Row]:
+    """
+    Lazily read rows of floats from a CSV stream.
+
+    Args:
+        stream (IO[str]): The text stream to read from.
+
+    Yields:
+        Row: The next non-empty row of the file.
+
+    Raises:
+        ValueError: If a row has a different width than the first row.
+    """
+    width = None
+    for line, row in enumerate(csv.reader(stream), start=1):
+        if not row:
+            continue
+        if width is None:
+            width = len(row)
+        elif len(row) != width:
+            raise ValueError(
+                f"Error: row {line} has {len(row)} values, expected {width}."
+            )
+        yield [float(x) for x in row]
+
+
+def read_binary_rows(
+    stream: IO[bytes], cols: int, chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> Iterator[Row]:
+    """
+    Lazily read rows of float64 values from a raw little-endian binary stream.
+
+    Args:
+        stream (IO[bytes]): The binary stream to read from.
+        cols (int): The number of values in each row.
+        chunk_rows (int): The number of rows read from the stream at once.
+
+    Yields:
+        Row: The next row of the file.
+
+    Raises:
+        ValueError: If the stream size is not a multiple of the row size.
+    """
+    if cols <= 0:
+        raise ValueError("Error: number of columns must be positive.")
+    row_size = cols * FLOAT_SIZE
+    while True:
+        data = stream.read(row_size * chunk_rows)
+        if not data:
+            return
+        if len(data) % row_size:
+            raise ValueError("Error: binary input is not a whole number of rows.")
+        values = array("d")
+        values.frombytes(data)
+        if sys.byteorder == "big":
+            values.byteswap()
+        for start in range(0, len(values), cols):
+            yield values[start : start + cols].tolist()
+
+
+def write_rows(
+    rows: Iterable[Row], stream: IO[bytes], fmt: str, chunk_rows: int
+) -> None:
+    """
+    Write rows of floats to a binary stream in the requested format.
+
+    Args:
+        rows (Iterable[Row]): The rows to write.
+        stream (IO[bytes]): The binary stream to write to.
+        fmt (str): The output format, ``"csv"`` or ``"bin"``.
+        chunk_rows (int): The number of rows buffered before each write.
+    """
+    for chunk in chunked(rows, chunk_rows):
+        if fmt == "csv":
+            lines = (",".join(repr(float(x)) for x in row) for row in chunk)
+            stream.write(("\n".join(lines) + "\n").encode())
+        else:
+            values = array("d", (x for row in chunk for x in row))
+            if sys.byteorder == "big":
+                values.byteswap()
+            stream.write(values.tobytes())
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    Split an iterable into lists of at most ``size`` items.
+
+    Args:
+        items (Iterable[T]): The items to split.
+        size (int): The maximum number of items in a chunk.
+
+    Yields:
+        List[T]: The next chunk of items.
+    """
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def paired(first: Iterable[Row], second: Iterable[Row]) -> Iterator[Tuple[Row, Row]]:
+    """
+    Pair the rows of two inputs.
+
+    Args:
+        first (Iterable[Row]): The rows of the first input.
+        second (Iterable[Row]): The rows of the second input.
+
+    Yields:
+        Tuple[Row, Row]: Rows with the same index in both inputs.
+
+    Raises:
+        ValueError: If the inputs have a different number of rows.
+    """
+    for pair in zip_longest(first, second):
+        if pair[0] is None or pair[1] is None:
+            raise ValueError("Error: inputs have a different number of rows.")
+        yield pair
+
+
+def run_multiply(a: Iterable[Row], b: Iterable[Row], chunk_rows: int) -> Iterator[Row]:
+    """
+    Multiply matrices, streaming the first one and keeping the second in memory.
+
+    Args:
+        a (Iterable[Row]): The rows of the first matrix.
+        b (Iterable[Row]): The rows of the second matrix.
+        chunk_rows (int): The number of rows of the first matrix multiplied at once.
+
+    Yields:
+        Row: The next row of the product.
+    """
+    b_rows = list(b)
+    for chunk in chunked(a, chunk_rows):
+        yield from matrix_multiplication(chunk, b_rows)
+
+
+def run_add(a: Iterable[Row], b: Iterable[Row], chunk_rows: int) -> Iterator[Row]:
+    """
+    Add matrices chunk by chunk.
+
+    Args:
+        a (Iterable[Row]): The rows of the first matrix.
+        b (Iterable[Row]): The rows of the second matrix.
+        chunk_rows (int): The number of rows added at once.
+
+    Yields:
+        Row: The next row of the sum.
+    """
+    for chunk in chunked(paired(a, b), chunk_rows):
+        yield from matrix_addition([x for x, _ in chunk], [y for _, y in chunk])
+
+
+def run_transpose(a: Iterable[Row], chunk_rows: int) -> Iterator[Row]:
+    """
+    Transpose a matrix. The whole matrix is loaded, since every output row
+    depends on every input row.
+
+    Args:
+        a (Iterable[Row]): The rows of the matrix.
+        chunk_rows (int): Unused, accepted for a uniform runner signature.
+
+    Yields:
+        Row: The next row of the transposed matrix.
+    """
+    rows = list(a)
+    if rows:
+        yield from matrix_transpose(rows)
+
+
+def run_dot(a: Iterable[Row], b: Iterable[Row], chunk_rows: int) -> Iterator[Row]:
+    """
+    Compute dot products of pairs of row vectors.
+
+    Args:
+        a (Iterable[Row]): The first vectors.
+        b (Iterable[Row]): The second vectors.
+        chunk_rows (int): Unused, accepted for a uniform runner signature.
+
+    Yields:
+        Row: A single-value row with the next dot product.
+    """
+    for x, y in paired(a, b):
+        yield [dot_product(x, y)]
+
+
+def run_angle(a: Iterable[Row], b: Iterable[Row], chunk_rows: int) -> Iterator[Row]:
+    """
+    Compute angles in degrees between pairs of row vectors.
+
+    Args:
+        a (Iterable[Row]): The first vectors.
+        b (Iterable[Row]): The second vectors.
+        chunk_rows (int): Unused, accepted for a uniform runner signature.
+
+    Yields:
+        Row: A single-value row with the next angle.
+    """
+    for x, y in paired(a, b):
+        yield [angle(x, y)]
+
+
+def run_norm(a: Iterable[Row], chunk_rows: int) -> Iterator[Row]:
+    """
+    Compute the length of each row vector.
+
+    Args:
+        a (Iterable[Row]): The vectors.
+        chunk_rows (int): Unused, accepted for a uniform runner signature.
+
+    Yields:
+        Row: A single-value row with the next length.
+    """
+    for x in a:
+        yield [vector_length(x)]
+
+
+RUNNERS: Dict[str, Callable[..., Iterator[Row]]] = {
+    "multiply": run_multiply,
+    "add": run_add,
+    "transpose": run_transpose,
+    "dot": run_dot,
+    "angle": run_angle,
+    "norm": run_norm,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line argument parser.
+
+    Returns:
+        argparse.ArgumentParser: The configured parser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m project",
+        description="Run matrix and vector operations over files.",
+    )
+    parser.add_argument("operation", choices=OPERATIONS)
+    parser.add_argument("inputs", nargs="+", help="input files, '-' for stdin")
+    parser.add_argument(
+        "-o", "--output", default="-", help="output file, stdout by default"
+    )
+    parser.add_argument(
+        "--format", choices=("csv", "bin"), default="csv", help="input format"
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=("csv", "bin"),
+        default=None,
+        help="output format, same as input by default",
+    )
+    parser.add_argument(
+        "--cols",
+        type=int,
+        nargs="+",
+        default=[],
+        help="columns per row of each binary input",
+    )
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=DEFAULT_CHUNK_ROWS,
+        help="number of rows processed at once",
+    )
+    return parser
+
+
+def open_input(
+    path: str, fmt: str, cols: Optional[int], chunk_rows: int
+) -> Tuple[IO[Any], Iterator[Row]]:
+    """
+    Open an input file and return its stream with a lazy iterator of rows.
+
+    Args:
+        path (str): The path to the file, ``"-"`` for stdin.
+        fmt (str): The input format, ``"csv"`` or ``"bin"``.
+        cols (Optional[int]): The number of values per row of a binary input.
+        chunk_rows (int): The number of rows read from a binary input at once.
+
+    Returns:
+        Tuple[IO[Any], Iterator[Row]]: The opened stream and the rows read from it.
+
+    Raises:
+        ValueError: If the number of columns of a binary input is unknown.
+    """
+    if fmt == "csv":
+        text_stream = sys.stdin if path == "-" else open(path, newline="")
+        return text_stream, read_csv_rows(text_stream)
+    if cols is None:
+        raise ValueError("Error: --cols is required for binary input.")
+    stream = sys.stdin.buffer if path == "-" else open(path, "rb")
+    return stream, read_binary_rows(stream, cols, chunk_rows)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the batch tool.
+
+    Args:
+        argv (Optional[List[str]]): Command-line arguments, ``sys.argv`` by default.
+
+    Returns:
+        int: The exit status.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    expected = 2 if args.operation in BINARY_OPERATIONS else 1
+    if len(args.inputs) != expected:
+        parser.error(f"{args.operation} expects {expected} input file(s)")
+    if args.chunk_rows <= 0:
+        parser.error("--chunk-rows must be positive")
+    if args.cols and args.format != "bin":
+        parser.error("--cols is only supported for binary input")
+    if len(args.cols) > expected:
+        parser.error(f"{args.operation} expects at most {expected} --cols value(s)")
+    if len(args.cols) == 1:
+        args.cols *= expected
+
+    streams = []
+    output = None
+    try:
+        rows = []
+        for i, path in enumerate(args.inputs):
+            cols = args.cols[i] if i < len(args.cols) else None
+            stream, reader = open_input(path, args.format, cols, args.chunk_rows)
+            streams.append(stream)
+            rows.append(reader)
+        output = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+        result = RUNNERS[args.operation](*rows, args.chunk_rows)
+        write_rows(result, output, args.output_format or args.format, args.chunk_rows)
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    finally:
+        for stream in streams:
+            if stream not in (sys.stdin, sys.stdin.buffer):
+                stream.close()
+        if output is not None and output is not sys.stdout.buffer:
+            output.close()
+        elif output is not None:
+            output.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,103 @@
-def curry_explicit(func, arity):
+from collections import OrderedDict
+from decimal import Decimal
+
+
+def _typed_key(arg):
+    """
+    Builds a cache key that also distinguishes equal values of different types.
+
+    Without the types ``True``, ``1`` and ``1.0`` would share one key. Floats, complex
+    numbers and decimals are keyed by ``repr``, so that ``0.0`` and ``-0.0`` or
+    ``Decimal("1.0")`` and ``Decimal("1.00")`` are kept apart too. Other objects
+    are keyed by their type and equality.
+
+    :param arg: A hashable argument
+    :return: The key of the argument
+    """
+    if isinstance(arg, tuple):
+        return type(arg), tuple(_typed_key(x) for x in arg)
+    if isinstance(arg, frozenset):
+        return type(arg), frozenset(_typed_key(x) for x in arg)
+    if isinstance(arg, (float, complex, Decimal)):
+        return type(arg), repr(arg)
+    return type(arg), arg
+
+
+def curry_explicit(func, arity, cache_size=0, stage=None, stage_arity=1):
     """
     Transforms a function into its curried form with the specified arity.
 
     Currying is the process of converting a function that takes multiple arguments
     into a sequence of functions, each taking a single argument.
 
+    Partial applications can be cached per prefix of arguments, so applying the same
+    prefix again returns the same function object. A staging function can precompute
+    work shared by all calls with the same prefix: ``stage(*prefix)`` is called once
+    the first ``stage_arity`` arguments are known and must return a function of the
+    remaining arguments, which is used instead of ``func``.
+
+    Only prefixes of hashable arguments are cached, since a cached partial application
+    keeps the argument objects it was created with. Equal arguments of different types,
+    and numbers that differ only in the sign of zero or in representation, get separate
+    entries (see ``_typed_key``). All cached prefixes share one LRU
+    of ``cache_size`` entries; applications past the staged prefix are not cached.
+
     :param func: The original function to be curried
     :param arity: The arity of the function (number of expected arguments)
+    :param cache_size: The maximum number of cached partial applications (LRU),
+        default is 0 (caching disabled)
+    :param stage: Optional staging function of the first ``stage_arity`` arguments
+    :param stage_arity: The number of arguments passed to the staging function
     :return: The curried function
-    :raises ValueError: If arity is negative
+    :raises ValueError: If arity is negative or stage_arity is out of range
     """
 
     if not isinstance(arity, int) or arity < 0:
         raise ValueError("Arity must be a non-negative integer.")
+    if stage is not None and (
+        not isinstance(stage_arity, int) or not 0 < stage_arity < arity
+    ):
+        raise ValueError("Stage arity must be a positive integer less than arity.")
+
+    cache = OrderedDict()  # Use OrderedDict to control insertion order
+
+    def make_partial(args):
+        """
+        Creates the partial application for a prefix of arguments.
+
+        :param args: The prefix of arguments
+        :return: The function expecting the remaining arguments
+        """
+        if stage is not None and len(args) == stage_arity:
+            # Precompute the shared work and curry the staged function
+            return curry_explicit(stage(*args), arity - stage_arity)
+        # Return a new function expecting the next argument
+        return lambda x: curried(*(args + (x,)))
+
+    def partial(args):
+        """
+        Returns the partial application for a prefix of arguments, from the cache if possible.
+
+        :param args: The prefix of arguments
+        :return: The function expecting the remaining arguments
+        """
+        if cache_size <= 0:
+            return make_partial(args)
+        key = tuple(_typed_key(arg) for arg in args)
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable arguments may change after caching, so they are not cached
+            return make_partial(args)
+
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        result = cache[key] = make_partial(args)
+        if len(cache) > cache_size:
+            cache.popitem(last=False)  # Remove the oldest item
+        return result
 
     def curried(*args):
         """
@@ -24,10 +109,11 @@ def curry_explicit(func, arity):
         """
         if len(args) > arity:
             raise TypeError(f"Expected {arity} arguments, got {len(args)}.")
+        if stage is not None and len(args) > stage_arity:
+            return partial(args[:stage_arity])(*args[stage_arity:])
         if len(args) == arity:
             return func(*args)
-        # Return a new function expecting the next argument
-        return lambda x: curried(*(args + (x,)))
+        return partial(args)
 
     return curried
 
@@ -1,12 +1,25 @@
-from typing import List
+import operator
+from collections.abc import Sequence
+from itertools import repeat
+from typing import Callable, Iterable, List, Optional, Union
 
 # Matrix operations
 
+# A scalar, a matrix of the same shape, a single row or a single column
+Operand = Union[float, List[List[float]]]
+
+ALGORITHMS = ("naive", "strassen")
+
+# Blocks of this size or smaller are multiplied with the naive kernel
+STRASSEN_CUTOFF = 64
+
 
 def matrix_addition(A: List[List[float]], B: List[List[float]]) -> List[List[float]]:
     """
     Add two matrices.
 
+    Use ``matrix_map(operator.add, A, B)`` to add a broadcast scalar, row or column.
+
     Args:
         A (List[List[float]]): The first matrix.
         B (List[List[float]]): The second matrix.
@@ -17,20 +30,15 @@ def matrix_addition(A: List[List[float]], B: List[List[float]]) -> List[List[flo
     Raises:
         ValueError: If the input matrices have different dimensions.
     """
-    if len(A) != len(B) or len(A[0]) != len(B[0]):
+    cols = len(A[0])
+    if len(A) != len(B) or not _has_width(A, cols) or not _has_width(B, cols):
         raise ValueError("Error: matrices of different dimensions.")
 
-    result_m = [[0.0] * len(A[0]) for _ in range(len(A))]
-
-    for i in range(len(A)):
-        for j in range(len(A[0])):
-            result_m[i][j] = A[i][j] + B[i][j]
-
-    return result_m
+    return _add(A, B)
 
 
 def matrix_multiplication(
-    A: List[List[float]], B: List[List[float]]
+    A: List[List[float]], B: List[List[float]], algorithm: str = "naive"
 ) -> List[List[float]]:
     """
     Multiply two matrices.
@@ -38,12 +46,16 @@ def matrix_multiplication(
     Args:
         A (List[List[float]]): The first matrix.
         B (List[List[float]]): The second matrix.
+        algorithm (str): The multiplication algorithm, one of ``ALGORITHMS``.
+            ``"strassen"`` is used for square matrices only, other shapes
+            are multiplied with the naive algorithm.
 
     Returns:
         List[List[float]]: The resulting matrix from the multiplication.
 
     Raises:
-        ValueError: If the number of columns in A does not match the number of rows in B.
+        ValueError: If the number of columns in A does not match the number of rows in B,
+            or the algorithm is unknown.
 
     Examples:
         >>> matrix_multiplication([[1, 2], [3, 4]], [[5, 6], [7, 8]])
@@ -53,15 +65,156 @@ def matrix_multiplication(
         raise ValueError(
             "Error: number of rows of first matrix and number of columns of second matrix are different."
         )
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Error: unknown multiplication algorithm {algorithm!r}.")
+    if algorithm == "strassen" and len(A) == len(B) == len(B[0]):
+        return strassen_multiplication(A, B)
 
     result_m = [[0.0] * len(B[0]) for _ in range(len(A))]
+    _multiply_into(A, B, result_m)
+
+    return result_m
+
 
+def _multiply_into(
+    A: List[List[float]], B: List[List[float]], out: List[List[float]]
+) -> None:
+    # Overwrites out with A * B; out must not share rows with A or B
     for i in range(len(A)):
+        row = out[i]
         for j in range(len(B[0])):
+            value = 0.0
             for k in range(len(B)):
-                result_m[i][j] += A[i][k] * B[k][j]
+                value += A[i][k] * B[k][j]
+            row[j] = value
 
-    return result_m
+
+def matrix_power(A: List[List[float]], k: int) -> List[List[float]]:
+    """
+    Raise a square matrix to a non-negative integer power.
+
+    Uses exponentiation by squaring, so about 2 * log2(k) products are computed
+    instead of k. The products are written into three preallocated buffers
+    that are reused at every step.
+
+    Args:
+        A (List[List[float]]): The square matrix.
+        k (int): The power.
+
+    Returns:
+        List[List[float]]: The matrix A raised to the power k.
+
+    Raises:
+        ValueError: If the matrix is not square or the power is negative.
+
+    Examples:
+        >>> matrix_power([[1, 1], [1, 0]], 10)
+        [[89.0, 55.0], [55.0, 34.0]]
+    """
+    n = len(A)
+    if any(len(row) != n for row in A):
+        raise ValueError("Error: matrix is not square.")
+    if not isinstance(k, int) or k < 0:
+        raise ValueError("Error: power must be a non-negative integer.")
+
+    result = [[float(i == j) for j in range(n)] for i in range(n)]
+    if k == 0:
+        return result
+    base = [[float(x) for x in row] for row in A]
+    tmp = [[0.0] * n for _ in range(n)]
+
+    # Skip the multiplication by the identity for the lowest set bit
+    while not k & 1:
+        _multiply_into(base, base, tmp)
+        base, tmp = tmp, base
+        k >>= 1
+    result, tmp = [row[:] for row in base], result
+    k >>= 1
+
+    while k:
+        _multiply_into(base, base, tmp)
+        base, tmp = tmp, base
+        if k & 1:
+            _multiply_into(result, base, tmp)
+            result, tmp = tmp, result
+        k >>= 1
+
+    return result
+
+
+def strassen_multiplication(
+    A: List[List[float]], B: List[List[float]], cutoff: int = STRASSEN_CUTOFF
+) -> List[List[float]]:
+    """
+    Multiply two square matrices with Strassen's algorithm.
+
+    Each level of recursion replaces 8 block products with 7. Blocks of size
+    ``cutoff`` or less are multiplied with the naive algorithm, and matrices
+    of odd size are padded with one zero row and column.
+
+    Args:
+        A (List[List[float]]): The first square matrix.
+        B (List[List[float]]): The second square matrix of the same size.
+        cutoff (int): The size at which the recursion stops.
+
+    Returns:
+        List[List[float]]: The resulting matrix from the multiplication.
+
+    Raises:
+        ValueError: If the matrices are not square matrices of the same size.
+    """
+    n = len(A)
+    if (
+        any(len(row) != n for row in A)
+        or len(B) != n
+        or any(len(row) != n for row in B)
+    ):
+        raise ValueError(
+            "Error: Strassen's algorithm expects square matrices of the same size."
+        )
+    return _strassen(A, B, max(cutoff, 1))
+
+
+def _strassen(
+    A: List[List[float]], B: List[List[float]], cutoff: int
+) -> List[List[float]]:
+    n = len(A)
+    if n <= cutoff:
+        return matrix_multiplication(A, B)
+    if n % 2:
+        # Pad to an even size and strip the extra row and column afterwards
+        A = [row + [0.0] for row in A] + [[0.0] * (n + 1)]
+        B = [row + [0.0] for row in B] + [[0.0] * (n + 1)]
+        return [row[:n] for row in _strassen(A, B, cutoff)[:n]]
+
+    h = n // 2
+    A11, A12 = [row[:h] for row in A[:h]], [row[h:] for row in A[:h]]
+    A21, A22 = [row[:h] for row in A[h:]], [row[h:] for row in A[h:]]
+    B11, B12 = [row[:h] for row in B[:h]], [row[h:] for row in B[:h]]
+    B21, B22 = [row[:h] for row in B[h:]], [row[h:] for row in B[h:]]
+
+    M1 = _strassen(_add(A11, A22), _add(B11, B22), cutoff)
+    M2 = _strassen(_add(A21, A22), B11, cutoff)
+    M3 = _strassen(A11, _sub(B12, B22), cutoff)
+    M4 = _strassen(A22, _sub(B21, B11), cutoff)
+    M5 = _strassen(_add(A11, A12), B22, cutoff)
+    M6 = _strassen(_sub(A21, A11), _add(B11, B12), cutoff)
+    M7 = _strassen(_sub(A12, A22), _add(B21, B22), cutoff)
+
+    C11 = _add(_sub(_add(M1, M4), M5), M7)
+    C12 = _add(M3, M5)
+    C21 = _add(M2, M4)
+    C22 = _add(_add(_sub(M1, M2), M3), M6)
+
+    return [r1 + r2 for r1, r2 in zip(C11, C12)] + [r1 + r2 for r1, r2 in zip(C21, C22)]
+
+
+def _add(A: List[List[float]], B: List[List[float]]) -> List[List[float]]:
+    return [list(map(operator.add, ra, rb)) for ra, rb in zip(A, B)]
+
+
+def _sub(A: List[List[float]], B: List[List[float]]) -> List[List[float]]:
+    return [list(map(operator.sub, ra, rb)) for ra, rb in zip(A, B)]
 
 
 def matrix_transpose(A: List[List[float]]) -> List[List[float]]:
@@ -81,3 +234,287 @@ def matrix_transpose(A: List[List[float]]) -> List[List[float]]:
             result_m[i][j] = A[j][i]
 
     return result_m
+
+
+def matrix_chain_order(dims: List[int]) -> List[List[int]]:
+    """
+    Find the optimal parenthesization of a matrix chain product.
+
+    The i-th matrix of the chain has shape ``dims[i] x dims[i + 1]``. Classic
+    dynamic programming over the chain, O(n^3) in the number of matrices.
+
+    Args:
+        dims (List[int]): The dimensions of the chain, one more than the number of matrices.
+
+    Returns:
+        List[List[int]]: The split table: ``split[i][j]`` is the index ``k`` such that
+            the product of matrices ``i..j`` is computed as ``(i..k) * (k+1..j)``.
+
+    Examples:
+        >>> matrix_chain_order([10, 100, 5, 50])[0][2]
+        1
+    """
+    n = len(dims) - 1
+    cost = [[0] * n for _ in range(n)]
+    split = [[0] * n for _ in range(n)]
+
+    for length in range(1, n):
+        for i in range(n - length):
+            j = i + length
+            best = -1
+            for k in range(i, j):
+                c = cost[i][k] + cost[k + 1][j] + dims[i] * dims[k + 1] * dims[j + 1]
+                if best < 0 or c < best:
+                    best = c
+                    split[i][j] = k
+            cost[i][j] = best
+
+    return split
+
+
+def multi_dot(matrices: List[List[List[float]]]) -> List[List[float]]:
+    """
+    Multiply a chain of matrices in the cheapest order.
+
+    The multiplication order is chosen by ``matrix_chain_order`` from the shapes
+    of the matrices, and each product is computed with ``matrix_multiplication``.
+
+    Args:
+        matrices (List[List[List[float]]]): The matrices to multiply, from left to right.
+
+    Returns:
+        List[List[float]]: The product of all matrices.
+
+    Raises:
+        ValueError: If the chain is empty or the shapes of neighbouring matrices do not match.
+
+    Examples:
+        >>> multi_dot([[[1, 2]], [[3], [4]], [[5, 6]]])
+        [[55.0, 66.0]]
+    """
+    if not matrices:
+        raise ValueError("Error: empty matrix chain.")
+
+    dims = [len(matrices[0])]
+    for i, M in enumerate(matrices):
+        if len(M) != dims[-1]:
+            raise ValueError(
+                f"Error: matrix {i} has {len(M)} rows, expected {dims[-1]}."
+            )
+        dims.append(len(M[0]))
+
+    if len(matrices) == 1:
+        return [row[:] for row in matrices[0]]
+
+    split = matrix_chain_order(dims)
+
+    def product(i: int, j: int) -> List[List[float]]:
+        if i == j:
+            return matrices[i]
+        k = split[i][j]
+        return matrix_multiplication(product(i, k), product(k + 1, j))
+
+    return product(0, len(matrices) - 1)
+
+
+# Element-wise operations
+
+
+def _broadcast(B: Operand, rows: int, cols: int) -> Iterable[Iterable[float]]:
+    """
+    Broadcast an operand to the shape of a matrix without copying it.
+
+    Args:
+        B (Operand): A scalar, a rows x cols matrix, a 1 x cols row or a rows x 1 column.
+        rows (int): The number of rows of the target shape.
+        cols (int): The number of columns of the target shape.
+
+    Returns:
+        Iterable[Iterable[float]]: The rows of the broadcast operand.
+
+    Raises:
+        ValueError: If the operand cannot be broadcast to the shape.
+    """
+    if not isinstance(B, Sequence):
+        # Anything that is not a matrix is a scalar, e.g. int, float or Decimal
+        return repeat([B] * cols, rows)
+    if len(B) == rows and _has_width(B, cols):
+        return B
+    if len(B) == 1 and _has_width(B, cols):
+        return repeat(B[0], rows)
+    if len(B) == rows and _has_width(B, 1):
+        return (repeat(row[0], cols) for row in B)
+    raise ValueError("Error: matrices of different dimensions.")
+
+
+def _has_width(A: List[List[float]], cols: int) -> bool:
+    # map and zip silently truncate, so every row has to be checked
+    return all(len(row) == cols for row in A)
+
+
+def matrix_map(
+    func: Callable[..., float], A: List[List[float]], *operands: Operand
+) -> List[List[float]]:
+    """
+    Apply a function element-wise to a matrix and broadcast operands.
+
+    Every row is computed with a single ``map`` call, so a composite expression
+    passed as ``func`` is evaluated in one pass without intermediate matrices.
+
+    Args:
+        func (Callable[..., float]): The function of one element of each argument.
+        A (List[List[float]]): The matrix that defines the shape of the result.
+        *operands (Operand): Scalars, matrices of the same shape, rows or columns.
+
+    Returns:
+        List[List[float]]: The resulting matrix.
+
+    Raises:
+        ValueError: If the rows of A have different lengths or an operand
+            cannot be broadcast to the shape of A.
+
+    Examples:
+        >>> matrix_map(lambda x, y, z: x * y - z, [[1, 2], [3, 4]], [[10], [100]], 1)
+        [[9, 19], [299, 399]]
+    """
+    rows, cols = len(A), len(A[0])
+    if not _has_width(A, cols):
+        raise ValueError("Error: matrix rows have different lengths.")
+    broadcast = [_broadcast(B, rows, cols) for B in operands]
+    return [list(map(func, row, *others)) for row, *others in zip(A, *broadcast)]
+
+
+def matrix_subtraction(A: List[List[float]], B: Operand) -> List[List[float]]:
+    """
+    Subtract a matrix, a scalar, a row or a column from a matrix element-wise.
+
+    Args:
+        A (List[List[float]]): The first matrix.
+        B (Operand): The operand broadcast to A.
+
+    Returns:
+        List[List[float]]: The resulting matrix A - B.
+
+    Raises:
+        ValueError: If B cannot be broadcast to the shape of A.
+    """
+    return matrix_map(operator.sub, A, B)
+
+
+def matrix_elementwise_multiplication(
+    A: List[List[float]], B: Operand
+) -> List[List[float]]:
+    """
+    Multiply a matrix by a matrix, a scalar, a row or a column element-wise.
+
+    Args:
+        A (List[List[float]]): The first matrix.
+        B (Operand): The operand broadcast to A.
+
+    Returns:
+        List[List[float]]: The resulting matrix.
+
+    Raises:
+        ValueError: If B cannot be broadcast to the shape of A.
+    """
+    return matrix_map(operator.mul, A, B)
+
+
+def matrix_scale(A: List[List[float]], c: float) -> List[List[float]]:
+    """
+    Multiply a matrix by a scalar.
+
+    Args:
+        A (List[List[float]]): The matrix.
+        c (float): The scalar.
+
+    Returns:
+        List[List[float]]: The resulting matrix c * A.
+    """
+    return [[c * x for x in row] for row in A]
+
+
+def _fma(x: float, y: float, z: float) -> float:
+    return x * y + z
+
+
+def matrix_fma(A: List[List[float]], B: Operand, C: Operand) -> List[List[float]]:
+    """
+    Compute A * B + C element-wise in a single pass.
+
+    Args:
+        A (List[List[float]]): The first matrix.
+        B (Operand): The multiplier broadcast to A.
+        C (Operand): The addend broadcast to A.
+
+    Returns:
+        List[List[float]]: The resulting matrix.
+
+    Raises:
+        ValueError: If B or C cannot be broadcast to the shape of A.
+    """
+    return matrix_map(_fma, A, B, C)
+
+
+def _reduce(
+    func: Callable[[Iterable[float]], float],
+    A: List[List[float]],
+    axis: Optional[int],
+) -> Union[float, List[float]]:
+    if not _has_width(A, len(A[0])):
+        raise ValueError("Error: matrix rows have different lengths.")
+    if axis is None:
+        return func(map(func, A))
+    if axis == 0:
+        return list(map(func, zip(*A)))
+    if axis == 1:
+        return list(map(func, A))
+    raise ValueError(f"Error: invalid axis {axis}, expected None, 0 or 1.")
+
+
+def matrix_sum(
+    A: List[List[float]], axis: Optional[int] = None
+) -> Union[float, List[float]]:
+    """
+    Sum the elements of a matrix.
+
+    Args:
+        A (List[List[float]]): The matrix.
+        axis (Optional[int]): None to sum all elements, 0 for the sum of each
+            column, 1 for the sum of each row.
+
+    Returns:
+        Union[float, List[float]]: The sum, or the list of sums along the axis.
+
+    Raises:
+        ValueError: If the rows have different lengths or the axis is invalid.
+
+    Examples:
+        >>> matrix_sum([[1, 2], [3, 4]], axis=0)
+        [4, 6]
+    """
+    return _reduce(sum, A, axis)
+
+
+def matrix_max(
+    A: List[List[float]], axis: Optional[int] = None
+) -> Union[float, List[float]]:
+    """
+    Find the maximum element of a matrix.
+
+    Args:
+        A (List[List[float]]): The matrix.
+        axis (Optional[int]): None for the maximum of all elements, 0 for the
+            maximum of each column, 1 for the maximum of each row.
+
+    Returns:
+        Union[float, List[float]]: The maximum, or the list of maxima along the axis.
+
+    Raises:
+        ValueError: If the rows have different lengths or the axis is invalid.
+
+    Examples:
+        >>> matrix_max([[1, 5], [3, 4]], axis=1)
+        [5, 4]
+    """
+    return _reduce(max, A, axis)
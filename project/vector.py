@@ -1,5 +1,11 @@
+import operator
+from collections.abc import Sequence
+from itertools import repeat
 from math import sqrt, acos, degrees
-from typing import List
+from typing import Callable, Iterable, List, Tuple, Union
+
+# A scalar or a vector of the same length
+Operand = Union[float, List[float]]
 
 
 def dot_product(v1: List[float], v2: List[float]) -> float:
@@ -46,6 +52,70 @@ def vector_length(v: List[float]) -> float:
     return sqrt(sum(x**2 for x in v))
 
 
+def _dot_and_squared_lengths(
+    v1: List[float], v2: List[float]
+) -> Tuple[float, float, float]:
+    # Single pass over both vectors instead of one dot product and two lengths
+    if len(v1) != len(v2):
+        raise ValueError("Error: vector lengths are not equal.")
+
+    dot = sq1 = sq2 = 0.0
+    for x, y in zip(v1, v2):
+        dot += x * y
+        sq1 += x * x
+        sq2 += y * y
+    return dot, sq1, sq2
+
+
+def clamped_cosine(dot: float, length1: float, length2: float) -> float:
+    """
+    Calculate the cosine of the angle between two non-zero vectors from their
+    dot product and lengths.
+
+    Parameters
+    ----------
+    dot : float
+        The dot product of the vectors.
+    length1 : float
+        The length of the first vector.
+    length2 : float
+        The length of the second vector.
+
+    Returns
+    -------
+    float
+        The cosine clamped to [-1, 1], since rounding can push it slightly outside.
+    """
+    return max(-1.0, min(1.0, dot / (length1 * length2)))
+
+
+def cosine_similarity(v1: List[float], v2: List[float]) -> float:
+    """
+    Calculate the cosine of the angle between two vectors.
+
+    Parameters
+    ----------
+    v1 : List[float]
+        The first input vector.
+    v2 : List[float]
+        The second input vector.
+
+    Returns
+    -------
+    float
+        The cosine similarity in the range [-1, 1], or 0.0 if either vector is zero.
+
+    Raises
+    ------
+    ValueError
+        If the lengths of the input vectors are not equal.
+    """
+    dot, sq1, sq2 = _dot_and_squared_lengths(v1, v2)
+    if sq1 == 0.0 or sq2 == 0.0:
+        return 0.0
+    return clamped_cosine(dot, sqrt(sq1), sqrt(sq2))
+
+
 def angle(v1: List[float], v2: List[float]) -> float:
     """
     Calculate the angle between two vectors in degrees.
@@ -61,6 +131,161 @@ def angle(v1: List[float], v2: List[float]) -> float:
     -------
     float
         The angle between the two vectors in degrees.
+
+    Raises
+    ------
+    ValueError
+        If the lengths of the input vectors are not equal or either vector is zero.
+    """
+    dot, sq1, sq2 = _dot_and_squared_lengths(v1, v2)
+    if sq1 == 0.0 or sq2 == 0.0:
+        raise ValueError("Error: angle with a zero vector is undefined.")
+    return degrees(acos(clamped_cosine(dot, sqrt(sq1), sqrt(sq2))))
+
+
+def _broadcast(u: Operand, n: int) -> Iterable[float]:
+    """
+    Broadcast a scalar or a vector to the length of a vector without copying it.
+
+    Parameters
+    ----------
+    u : Operand
+        A scalar or a vector of length n.
+    n : int
+        The target length.
+
+    Returns
+    -------
+    Iterable[float]
+        The elements of the broadcast operand.
+
+    Raises
+    ------
+    ValueError
+        If the operand is a vector of another length.
+    """
+    if not isinstance(u, Sequence):
+        # Anything that is not a vector is a scalar, e.g. int, float or Decimal
+        return repeat(u, n)
+    if len(u) != n:
+        raise ValueError("Error: vector lengths are not equal.")
+    return u
+
+
+def vector_map(
+    func: Callable[..., float], v: List[float], *operands: Operand
+) -> List[float]:
+    """
+    Apply a function element-wise to a vector and broadcast operands.
+
+    Parameters
+    ----------
+    func : Callable[..., float]
+        The function of one element of each argument.
+    v : List[float]
+        The vector that defines the length of the result.
+    *operands : Operand
+        Scalars or vectors of the same length.
+
+    Returns
+    -------
+    List[float]
+        The resulting vector.
+
+    Raises
+    ------
+    ValueError
+        If an operand is a vector of another length.
+    """
+    return list(map(func, v, *(_broadcast(u, len(v)) for u in operands)))
+
+
+def vector_addition(v1: List[float], v2: Operand) -> List[float]:
+    """
+    Add a vector or a scalar to a vector element-wise.
+
+    Parameters
+    ----------
+    v1 : List[float]
+        The first input vector.
+    v2 : Operand
+        The second input vector or a scalar.
+
+    Returns
+    -------
+    List[float]
+        The sum of the vectors.
+
+    Raises
+    ------
+    ValueError
+        If the lengths of the input vectors are not equal.
+    """
+    return vector_map(operator.add, v1, v2)
+
+
+def vector_subtraction(v1: List[float], v2: Operand) -> List[float]:
+    """
+    Subtract a vector or a scalar from a vector element-wise.
+
+    Parameters
+    ----------
+    v1 : List[float]
+        The first input vector.
+    v2 : Operand
+        The second input vector or a scalar.
+
+    Returns
+    -------
+    List[float]
+        The difference of the vectors.
+
+    Raises
+    ------
+    ValueError
+        If the lengths of the input vectors are not equal.
+    """
+    return vector_map(operator.sub, v1, v2)
+
+
+def vector_elementwise_multiplication(v1: List[float], v2: Operand) -> List[float]:
+    """
+    Multiply a vector by a vector or a scalar element-wise.
+
+    Parameters
+    ----------
+    v1 : List[float]
+        The first input vector.
+    v2 : Operand
+        The second input vector or a scalar.
+
+    Returns
+    -------
+    List[float]
+        The element-wise product of the vectors.
+
+    Raises
+    ------
+    ValueError
+        If the lengths of the input vectors are not equal.
+    """
+    return vector_map(operator.mul, v1, v2)
+
+
+def vector_scale(v: List[float], c: float) -> List[float]:
+    """
+    Multiply a vector by a scalar.
+
+    Parameters
+    ----------
+    v : List[float]
+        The input vector.
+    c : float
+        The scalar.
+
+    Returns
+    -------
+    List[float]
+        The scaled vector.
     """
-    cos_theta = dot_product(v1, v2) / (vector_length(v1) * vector_length(v2))
-    return degrees(acos(cos_theta))
+    return [c * x for x in v]
@@ -0,0 +1,152 @@
+import random
+from math import acos, degrees
+from typing import Dict, List, Optional, Set, Tuple
+
+from project.vector import clamped_cosine, dot_product, vector_length
+
+
+class AngleIndex:
+    """
+    Approximate nearest-neighbour index of vectors by angle.
+
+    Uses random-hyperplane locality-sensitive hashing: every table hashes a
+    vector to the signs of its projections onto ``n_bits`` random hyperplanes,
+    so vectors with a small angle between them tend to share a bucket. A query
+    collects the vectors from its buckets in all tables and re-ranks them
+    exactly by angle.
+
+    Recall grows with ``n_tables`` and ``probes`` and drops with ``n_bits``,
+    while the number of candidates compared exactly changes the other way.
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        n_tables: int = 8,
+        n_bits: int = 8,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize an empty index.
+
+        :param dim: The dimension of indexed vectors
+        :param n_tables: The number of hash tables
+        :param n_bits: The number of hyperplanes per table
+        :param seed: The seed for the random hyperplanes
+        :raises ValueError: If any of the sizes is not positive
+        """
+        if dim <= 0 or n_tables <= 0 or n_bits <= 0:
+            raise ValueError("Dimension, number of tables and bits must be positive.")
+        rng = random.Random(seed)
+        self.dim = dim
+        self.planes = [
+            [[rng.gauss(0.0, 1.0) for _ in range(dim)] for _ in range(n_bits)]
+            for _ in range(n_tables)
+        ]
+        self.tables: List[Dict[int, List[int]]] = [{} for _ in range(n_tables)]
+        self.vectors: List[List[float]] = []
+        self.lengths: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    def _check(self, v: List[float]) -> float:
+        """
+        Validate a vector and return its length.
+
+        :param v: The vector
+        :return: The length of the vector
+        :raises ValueError: If the vector has a wrong dimension or is zero
+        """
+        if len(v) != self.dim:
+            raise ValueError(f"Expected a vector of length {self.dim}, got {len(v)}.")
+        length = vector_length(v)
+        if length == 0.0:
+            raise ValueError("Zero vectors cannot be indexed or queried by angle.")
+        return length
+
+    def _projections(self, v: List[float]) -> List[List[float]]:
+        """
+        Project a vector onto the hyperplanes of every table.
+
+        :param v: The vector
+        :return: The projections, one list per table
+        """
+        return [[dot_product(p, v) for p in planes] for planes in self.planes]
+
+    def add(self, v: List[float]) -> int:
+        """
+        Add a vector to the index.
+
+        :param v: The vector to add
+        :return: The id of the vector, its position in insertion order
+        :raises ValueError: If the vector has a wrong dimension or is zero
+        """
+        length = self._check(v)
+        idx = len(self.vectors)
+        self.vectors.append(list(v))
+        self.lengths.append(length)
+        for table, projections in zip(self.tables, self._projections(v)):
+            table.setdefault(_signature(projections), []).append(idx)
+        return idx
+
+    def extend(self, vectors: List[List[float]]) -> None:
+        """
+        Add several vectors to the index.
+
+        :param vectors: The vectors to add
+        """
+        for v in vectors:
+            self.add(v)
+
+    def query(
+        self, v: List[float], k: int = 1, probes: int = 0
+    ) -> List[Tuple[int, float]]:
+        """
+        Find approximately the k vectors with the smallest angle to the query.
+
+        :param v: The query vector
+        :param k: The number of neighbours to return
+        :param probes: The number of extra buckets probed per table; each one
+            differs from the query bucket in one of the bits closest to flipping
+        :return: Pairs of vector id and angle in degrees, sorted by angle; fewer
+            than k pairs if not enough candidates were found
+        :raises ValueError: If the vector has a wrong dimension or is zero,
+            k is not positive or probes is negative
+        """
+        if k <= 0 or probes < 0:
+            raise ValueError(
+                "Number of neighbours must be positive and probes non-negative."
+            )
+        length = self._check(v)
+        candidates: Set[int] = set()
+        for table, projections in zip(self.tables, self._projections(v)):
+            signature = _signature(projections)
+            candidates.update(table.get(signature, ()))
+            # Multi-probe: flip the bits whose projections are closest to zero
+            closest = sorted(range(len(projections)), key=lambda b: abs(projections[b]))
+            for bit in closest[:probes]:
+                candidates.update(table.get(signature ^ (1 << bit), ()))
+
+        ranked = []
+        for idx in candidates:
+            cos_theta = clamped_cosine(
+                dot_product(v, self.vectors[idx]), length, self.lengths[idx]
+            )
+            ranked.append((idx, degrees(acos(cos_theta))))
+        ranked.sort(key=lambda pair: pair[1])
+        return ranked[:k]
+
+
+def _signature(projections: List[float]) -> int:
+    """
+    Pack the signs of projections into an integer bucket key.
+
+    :param projections: The projections of a vector onto hyperplanes
+    :return: The bucket key
+    """
+    signature = 0
+    for bit, p in enumerate(projections):
+        if p >= 0:
+            signature |= 1 << bit
+    return signature
@@ -0,0 +1,41 @@
+import statistics
+import subprocess
+import sys
+import time
+
+import shared
+
+REPEATS = 20
+
+
+def measure(code):
+    """
+    Run the code in a fresh interpreter several times and return the median time.
+
+    :param code: Python source to execute
+    :return: Median wall-clock time in milliseconds
+    """
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        subprocess.check_call([sys.executable, "-c", code])
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    shared.configure_python_path()
+    baseline = measure("pass")
+    cases = {
+        "import project": "import project",
+        "import project + all submodules": "import project\n"
+        "for name in project.__all__: getattr(project, name)",
+    }
+    print(f"{'interpreter startup':35} {baseline:8.2f} ms")
+    for name, code in cases.items():
+        elapsed = measure(code)
+        print(f"{name:35} {elapsed:8.2f} ms (+{elapsed - baseline:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import random
+import sys
+import timeit
+from functools import reduce
+
+import shared
+
+sys.path.insert(0, str(shared.ROOT))
+
+from project.matrix import matrix_multiplication, multi_dot  # noqa: E402
+
+REPEATS = 3
+
+# Chains with skewed dimensions where the left-to-right order is expensive
+CHAINS = {
+    "wide-narrow-wide": [60, 2, 60, 2, 60],
+    "vector at the end": [40, 40, 40, 40, 1],
+    "outer product first": [80, 1, 80, 80],
+}
+
+
+def random_matrix(rows, cols):
+    return [[random.random() for _ in range(cols)] for _ in range(rows)]
+
+
+def main():
+    for name, dims in CHAINS.items():
+        chain = [random_matrix(dims[i], dims[i + 1]) for i in range(len(dims) - 1)]
+        naive = min(
+            timeit.repeat(
+                lambda: reduce(matrix_multiplication, chain), number=1, repeat=REPEATS
+            )
+        )
+        planned = min(timeit.repeat(lambda: multi_dot(chain), number=1, repeat=REPEATS))
+        print(
+            f"{name:22} left-to-right {naive * 1000:9.2f} ms"
+            f"  multi_dot {planned * 1000:9.2f} ms  x{naive / planned:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
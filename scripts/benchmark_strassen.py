@@ -0,0 +1,37 @@
+import random
+import sys
+import timeit
+
+import shared
+
+sys.path.insert(0, str(shared.ROOT))
+
+from project.matrix import matrix_multiplication, strassen_multiplication  # noqa: E402
+
+SIZES = [64, 128, 200, 256]
+CUTOFFS = [16, 32, 64, 128]
+
+
+def random_matrix(n):
+    return [[random.random() for _ in range(n)] for _ in range(n)]
+
+
+def measure(func):
+    return min(timeit.repeat(func, number=1, repeat=7)) * 1000
+
+
+def main():
+    print(
+        f"{'n':>5} {'naive':>10}" + "".join(f" {'cut=' + str(c):>10}" for c in CUTOFFS)
+    )
+    for n in SIZES:
+        A, B = random_matrix(n), random_matrix(n)
+        line = f"{n:5} {measure(lambda: matrix_multiplication(A, B)):8.1f}ms"
+        for cutoff in CUTOFFS:
+            elapsed = measure(lambda: strassen_multiplication(A, B, cutoff))
+            line += f" {elapsed:8.1f}ms"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import random
+import sys
+import time
+
+import shared
+
+sys.path.insert(0, str(shared.ROOT))
+
+from project.vector import angle  # noqa: E402
+from project.vector_index import AngleIndex  # noqa: E402
+
+DIM = 32
+SIZES = [1000, 5000, 20000]
+QUERIES = 50
+K = 10
+
+
+def random_vector():
+    return [random.gauss(0.0, 1.0) for _ in range(DIM)]
+
+
+def brute_force(vectors, query, k):
+    ranked = sorted(range(len(vectors)), key=lambda i: angle(query, vectors[i]))
+    return ranked[:k]
+
+
+def main():
+    random.seed(0)
+    for n in SIZES:
+        vectors = [random_vector() for _ in range(n)]
+        # Queries close to stored vectors, as in similarity lookups
+        queries = [
+            [x + random.gauss(0.0, 0.3) for x in random.choice(vectors)]
+            for _ in range(QUERIES)
+        ]
+        index = AngleIndex(DIM, n_tables=10, n_bits=8, seed=0)
+        index.extend(vectors)
+
+        start = time.perf_counter()
+        exact = [brute_force(vectors, q, K) for q in queries]
+        brute_time = (time.perf_counter() - start) / QUERIES * 1000
+
+        for probes in (0, 4):
+            start = time.perf_counter()
+            approx = [index.query(q, K, probes) for q in queries]
+            index_time = (time.perf_counter() - start) / QUERIES * 1000
+            recall = sum(
+                len(set(e) & {idx for idx, _ in a}) for e, a in zip(exact, approx)
+            ) / (K * QUERIES)
+            print(
+                f"n={n:6} probes={probes} brute force {brute_time:8.2f} ms"
+                f"  index {index_time:7.2f} ms  recall@{K} {recall:.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
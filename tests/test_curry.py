@@ -1,3 +1,6 @@
+import math
+from decimal import Decimal
+
 import pytest
 from project.curry import curry_explicit, uncurry_explicit
 
@@ -95,3 +98,105 @@ def test_curry_variable_arity_function():
 
     f_uncurried = uncurry_explicit(f_curried, 2)
     assert f_uncurried(1, 2) == 3
+
+
+def test_curry_partial_cache():
+    """
+    Test caching of partial applications per prefix of arguments.
+    """
+
+    def f(x, y, z):
+        return x + y + z
+
+    f_curried = curry_explicit(f, 3, cache_size=2)
+    assert f_curried(1) is f_curried(1)
+    assert f_curried(1, 2) is f_curried(1, 2)
+    assert f_curried(1)(2)(3) == 6
+
+    # Least recently used prefix is evicted
+    g = f_curried(1)
+    f_curried(2)
+    f_curried(3)
+    assert f_curried(1) is not g
+
+
+def test_curry_partial_cache_arguments():
+    """
+    Test that cached partial applications are called with the given arguments.
+    """
+
+    def f(x, y):
+        return x, y
+
+    f_curried = curry_explicit(f, 2, cache_size=4)
+
+    # Unhashable arguments are not cached and mutation does not leak
+    xs = [1, 2]
+    f_curried(xs)
+    xs.append(3)
+    assert f_curried([1, 2])(0) == ([1, 2], 0)
+    assert f_curried([1, 2]) is not f_curried([1, 2])
+
+    # Values with the same serialization are not mixed up
+    assert f_curried("[1, 2]")(0) == ("[1, 2]", 0)
+
+    # Equal values of different types get separate partial applications
+    for x in (1, True, 1.0, (1,), (True,)):
+        result = f_curried(x)(0)
+        assert result == (x, 0) and type(result[0]) is type(x)
+        if isinstance(x, tuple):
+            assert type(result[0][0]) is type(x[0])
+
+    # Numbers that compare and hash equal but are distinct values
+    g = curry_explicit(lambda x, y: math.copysign(1, x), 2, cache_size=4)
+    assert g(0.0)(1) == 1.0
+    assert g(-0.0)(1) == -1.0
+    assert g((-0.0,)) is not g((0.0,))
+    assert str(f_curried(Decimal("1.0"))(0)[0]) == "1.0"
+    assert str(f_curried(Decimal("1.00"))(0)[0]) == "1.00"
+
+
+def test_curry_stage():
+    """
+    Test precomputing shared work from a prefix of arguments.
+    """
+    calls = []
+
+    def stage(scale):
+        calls.append(scale)
+        return lambda x, y: scale * (x + y)
+
+    def f(scale, x, y):
+        return scale * (x + y)
+
+    f_curried = curry_explicit(f, 3, cache_size=4, stage=stage)
+    assert f_curried(10)(1)(2) == 30
+    assert f_curried(10, 2, 3) == 50
+    assert f_curried(10, 4)(5) == 90
+    assert calls == [10]  # Staged once for the same prefix
+
+    # One LRU for the whole function: applications past the staged prefix are not cached
+    assert f_curried(10) is f_curried(10)
+    assert f_curried(10)(1) is not f_curried(10)(1)
+
+    # Without a cache the staged function is reused through the partial application
+    calls.clear()
+    g = curry_explicit(f, 3, stage=stage)(10)
+    assert [g(1)(2), g(3, 4)] == [30, 70]
+    assert calls == [10]
+
+    # Unhashable prefixes are staged again, since they are not cached
+    def stage_sum(xs):
+        calls.append(xs)
+        total = sum(xs)
+        return lambda y: total + y
+
+    calls.clear()
+    h = curry_explicit(lambda xs, y: sum(xs) + y, 2, cache_size=4, stage=stage_sum)
+    assert [h([1, 2])(3), h([1, 2])(4)] == [6, 7]
+    assert len(calls) == 2
+
+    with pytest.raises(TypeError):
+        f_curried(10, 1, 2, 3)
+    with pytest.raises(ValueError):
+        curry_explicit(f, 3, stage=stage, stage_arity=3)
@@ -0,0 +1,97 @@
+import subprocess
+import sys
+from array import array
+
+import pytest
+from project.__main__ import main, read_binary_rows, read_csv_rows
+
+
+def write_csv(path, rows):
+    path.write_text("\n".join(",".join(str(x) for x in row) for row in rows) + "\n")
+    return str(path)
+
+
+def read_csv(path):
+    with open(path, newline="") as f:
+        return list(read_csv_rows(f))
+
+
+def test_multiply_csv(tmp_path):
+    a = write_csv(tmp_path / "a.csv", [[1, 2], [3, 4], [5, 6]])
+    b = write_csv(tmp_path / "b.csv", [[5, 6], [7, 8]])
+    out = str(tmp_path / "out.csv")
+    assert main(["multiply", a, b, "-o", out, "--chunk-rows", "2"]) == 0
+    assert read_csv(out) == [[19, 22], [43, 50], [67, 78]]
+
+
+def test_add_and_transpose_csv(tmp_path):
+    a = write_csv(tmp_path / "a.csv", [[1, 2, 3], [4, 5, 6]])
+    b = write_csv(tmp_path / "b.csv", [[1, 1, 1], [2, 2, 2]])
+    out = str(tmp_path / "out.csv")
+    assert main(["add", a, b, "-o", out]) == 0
+    assert read_csv(out) == [[2, 3, 4], [6, 7, 8]]
+    assert main(["transpose", a, "-o", out]) == 0
+    assert read_csv(out) == [[1, 4], [2, 5], [3, 6]]
+
+
+def test_vector_operations_csv(tmp_path):
+    a = write_csv(tmp_path / "a.csv", [[1, 0], [3, 4]])
+    b = write_csv(tmp_path / "b.csv", [[0, 3], [3, 4]])
+    out = str(tmp_path / "out.csv")
+    assert main(["dot", a, b, "-o", out]) == 0
+    assert read_csv(out) == [[0], [25]]
+    assert main(["norm", a, "-o", out]) == 0
+    assert read_csv(out) == [[1], [5]]
+    assert main(["angle", a, b, "-o", out]) == 0
+    assert read_csv(out) == [[pytest.approx(90.0)], [pytest.approx(0.0, abs=1e-6)]]
+
+
+def test_binary_input_and_output(tmp_path):
+    a = tmp_path / "a.bin"
+    a.write_bytes(array("d", [1, 2, 3, 4]).tobytes())
+    out = tmp_path / "out.bin"
+    args = ["transpose", str(a), "-o", str(out), "--format", "bin", "--cols", "2"]
+    assert main(args) == 0
+    with open(out, "rb") as f:
+        assert list(read_binary_rows(f, 2, chunk_rows=1)) == [[1, 3], [2, 4]]
+
+
+def test_errors(tmp_path):
+    a = write_csv(tmp_path / "a.csv", [[1, 2], [3, 4]])
+    b = write_csv(tmp_path / "b.csv", [[1, 2]])
+    # Inputs with a different number of rows
+    assert main(["add", a, b, "-o", str(tmp_path / "out.csv")]) == 1
+    # Binary input without --cols
+    assert main(["norm", a, "--format", "bin"]) == 1
+    # Rows of different widths
+    c = write_csv(tmp_path / "c.csv", [[1, 2], [3]])
+    assert main(["multiply", c, a, "-o", str(tmp_path / "out.csv")]) == 1
+    assert main(["add", a, c, "-o", str(tmp_path / "out.csv")]) == 1
+    # Inputs with a different number of columns
+    e = write_csv(tmp_path / "e.csv", [[10], [20]])
+    assert main(["add", a, e, "-o", str(tmp_path / "out.csv")]) == 1
+    # Binary input that is not a whole number of rows
+    d = tmp_path / "d.bin"
+    d.write_bytes(array("d", [1, 2, 3]).tobytes())
+    args = ["norm", str(d), "-o", str(tmp_path / "out.bin"), "--format", "bin"]
+    assert main(args + ["--cols", "2"]) == 1
+    # Wrong number of inputs
+    with pytest.raises(SystemExit):
+        main(["dot", a])
+    # --cols for CSV input
+    with pytest.raises(SystemExit):
+        main(["norm", a, "--cols", "2"])
+    # More --cols values than inputs
+    with pytest.raises(SystemExit):
+        main(["norm", a, "--format", "bin", "--cols", "2", "2"])
+
+
+def test_stdout_output(tmp_path):
+    a = write_csv(tmp_path / "a.csv", [[3, 4]])
+    result = subprocess.run(
+        [sys.executable, "-m", "project", "norm", a],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout == "5.0\n"
@@ -1,8 +1,24 @@
+import operator
+import random
+from decimal import Decimal
+
 import pytest
 from project.matrix import (
     matrix_addition,
     matrix_multiplication,
     matrix_transpose,
+    matrix_chain_order,
+    multi_dot,
+    strassen_multiplication,
+    STRASSEN_CUTOFF,
+    matrix_power,
+    matrix_map,
+    matrix_subtraction,
+    matrix_elementwise_multiplication,
+    matrix_scale,
+    matrix_fma,
+    matrix_sum,
+    matrix_max,
 )
 
 
@@ -20,6 +36,14 @@ def test_matrix_addition():
     B = [[6, 5], [4, 3]]
     assert matrix_addition(A, B) == [[6, 5], [4, 3]]
 
+    # Rows and columns are not broadcast, matrix_map does that
+    A = [[1, 2], [3, 4]]
+    with pytest.raises(ValueError):
+        matrix_addition(A, [[10, 20]])
+    with pytest.raises(ValueError):
+        matrix_addition(A, [[10], [20]])
+    assert matrix_map(operator.add, A, [[10], [20]]) == [[11, 12], [23, 24]]
+
 
 def test_matrix_multiplication():
     A = [[2, 3], [5, 7]]
@@ -58,3 +82,156 @@ def test_matrix_transpose():
     # Test case for a square matrix
     B = [[2, 4], [6, 8]]
     assert matrix_transpose(B) == [[2, 6], [4, 8]]
+
+
+def test_matrix_chain_order():
+    # (A * B) * C is cheaper for 10x100, 100x5, 5x50
+    assert matrix_chain_order([10, 100, 5, 50])[0][2] == 1
+    # A * (B * C) is cheaper for 50x5, 5x100, 100x10
+    assert matrix_chain_order([50, 5, 100, 10])[0][2] == 0
+
+
+def test_multi_dot():
+    A = [[1, 2], [3, 1], [4, 5]]
+    B = [[2, 3, 4], [1, 0, 2]]
+    C = [[1], [0], [2]]
+    expected = matrix_multiplication(matrix_multiplication(A, B), C)
+    assert multi_dot([A, B, C]) == expected
+    assert multi_dot([A, B]) == matrix_multiplication(A, B)
+
+    # Chain of a single matrix returns a copy
+    result = multi_dot([A])
+    assert result == A and result is not A
+
+    # Test case for an empty chain
+    with pytest.raises(ValueError):
+        multi_dot([])
+
+    # Test case for incompatible matrix sizes
+    with pytest.raises(ValueError):
+        multi_dot([A, C])
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 8, 13, 20])
+def test_strassen_multiplication(n):
+    rng = random.Random(n)
+    A = [[rng.uniform(-10, 10) for _ in range(n)] for _ in range(n)]
+    B = [[rng.uniform(-10, 10) for _ in range(n)] for _ in range(n)]
+    expected = matrix_multiplication(A, B)
+
+    # Small cutoff to go through several levels of recursion and padding
+    result = strassen_multiplication(A, B, cutoff=2)
+    for row, expected_row in zip(result, expected):
+        assert row == pytest.approx(expected_row, rel=1e-9, abs=1e-9)
+
+    result = matrix_multiplication(A, B, algorithm="strassen")
+    for row, expected_row in zip(result, expected):
+        assert row == pytest.approx(expected_row, rel=1e-9, abs=1e-9)
+
+
+def test_strassen_multiplication_above_cutoff():
+    # Odd size above STRASSEN_CUTOFF: dispatch, one level of padding and recursion
+    n = STRASSEN_CUTOFF + 1
+    rng = random.Random(n)
+    A = [[rng.uniform(-10, 10) for _ in range(n)] for _ in range(n)]
+    B = [[rng.uniform(-10, 10) for _ in range(n)] for _ in range(n)]
+    expected = matrix_multiplication(A, B)
+    result = matrix_multiplication(A, B, algorithm="strassen")
+    assert len(result) == n
+    for row, expected_row in zip(result, expected):
+        assert row == pytest.approx(expected_row, rel=1e-9, abs=1e-9)
+
+
+def test_strassen_multiplication_errors():
+    # Test case for non-square matrices
+    with pytest.raises(ValueError):
+        strassen_multiplication([[1, 2]], [[1], [2]])
+
+    # Non-square matrices fall back to the naive algorithm
+    A = [[1, 2], [3, 1], [4, 5]]
+    B = [[2, 3, 4], [1, 0, 2]]
+    assert matrix_multiplication(A, B, algorithm="strassen") == matrix_multiplication(
+        A, B
+    )
+
+    # Test case for an unknown algorithm
+    with pytest.raises(ValueError):
+        matrix_multiplication([[1]], [[1]], algorithm="unknown")
+
+
+def test_matrix_power():
+    A = [[1, 2], [3, 4]]
+    expected = [[1, 0], [0, 1]]
+    for k in range(13):
+        assert matrix_power(A, k) == expected
+        expected = matrix_multiplication(expected, A)
+
+    # Fibonacci numbers
+    assert matrix_power([[1, 1], [1, 0]], 30)[0][1] == 832040
+
+    # The input matrix is not modified
+    assert A == [[1, 2], [3, 4]]
+
+    # Test case for a non-square matrix
+    with pytest.raises(ValueError):
+        matrix_power([[1, 2]], 2)
+
+    # Test case for a negative power
+    with pytest.raises(ValueError):
+        matrix_power(A, -1)
+
+
+def test_elementwise_operations():
+    A = [[1, 2, 3], [4, 5, 6]]
+    B = [[6, 5, 4], [3, 2, 1]]
+    assert matrix_subtraction(A, B) == [[-5, -3, -1], [1, 3, 5]]
+    assert matrix_subtraction(A, [[1], [4]]) == [[0, 1, 2], [0, 1, 2]]
+    assert matrix_elementwise_multiplication(A, B) == [[6, 10, 12], [12, 10, 6]]
+    assert matrix_elementwise_multiplication(A, [[0, 1, 2]]) == [[0, 2, 6], [0, 5, 12]]
+    assert matrix_scale(A, 2) == [[2, 4, 6], [8, 10, 12]]
+    assert matrix_fma(A, 2, B) == [[8, 9, 10], [11, 12, 13]]
+    assert matrix_map(abs, [[-1, 2], [3, -4]]) == [[1, 2], [3, 4]]
+    assert matrix_scale(A, Decimal(2)) == matrix_elementwise_multiplication(
+        A, Decimal(2)
+    )
+    assert matrix_map(operator.add, [[1, 2]], Decimal(1)) == [[2, 3]]
+    assert matrix_map(max, A, B, [[5], [0]]) == [[6, 5, 5], [4, 5, 6]]
+
+    # Test case for operands that cannot be broadcast
+    with pytest.raises(ValueError):
+        matrix_subtraction(A, [[1, 2]])
+    with pytest.raises(ValueError):
+        matrix_fma(A, B, [[1], [2], [3]])
+
+    # Test case for ragged matrices
+    with pytest.raises(ValueError):
+        matrix_addition([[1, 2], [3, 4]], [[1, 2], [3]])
+    with pytest.raises(ValueError):
+        matrix_subtraction([[1, 2], [3, 4]], [[1], [2, 5]])
+    with pytest.raises(ValueError):
+        matrix_elementwise_multiplication([[1, 2], [3, 4], [5, 6]], [[1, 2], [3]])
+    with pytest.raises(ValueError):
+        matrix_map(abs, [[1, 2], [3]])
+    with pytest.raises(ValueError):
+        matrix_map(operator.add, [[1, 2], [3]], 1)
+
+
+def test_reductions():
+    A = [[1, 7, 3], [4, 5, 6]]
+    assert matrix_sum(A) == 26
+    assert matrix_sum(A, axis=0) == [5, 12, 9]
+    assert matrix_sum(A, axis=1) == [11, 15]
+    assert matrix_max(A) == 7
+    assert matrix_max(A, axis=0) == [4, 7, 6]
+    assert matrix_max(A, axis=1) == [7, 6]
+
+    # Test case for an invalid axis
+    with pytest.raises(ValueError):
+        matrix_sum(A, axis=2)
+
+    # Test case for a ragged matrix
+    for axis in (None, 0, 1):
+        with pytest.raises(ValueError):
+            matrix_sum([[1, 2], [3]], axis=axis)
+        with pytest.raises(ValueError):
+            matrix_max([[1, 2], [3]], axis=axis)
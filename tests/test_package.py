@@ -0,0 +1,41 @@
+import subprocess
+import sys
+
+import pytest
+import project
+
+
+def _run(code):
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+
+def test_import_is_quiet():
+    """
+    Test that importing the package writes nothing to stdout.
+    """
+    assert _run("import project").stdout == ""
+
+
+def test_submodules_are_lazy():
+    """
+    Test that submodules are loaded only on first access.
+    """
+    code = (
+        "import sys, project\n"
+        "print('project.matrix' in sys.modules)\n"
+        "project.matrix\n"
+        "print('project.matrix' in sys.modules)\n"
+    )
+    assert _run(code).stdout.split() == ["False", "True"]
+
+
+def test_lazy_attribute_access():
+    """
+    Test access to submodules and unknown attributes through the package.
+    """
+    assert project.vector.dot_product([1, 2], [3, 4]) == 11
+    assert "curry" in dir(project)
+    with pytest.raises(AttributeError):
+        project.missing
@@ -1,8 +1,17 @@
+from decimal import Decimal
+
 import pytest
 from project.vector import (
     dot_product,
     vector_length,
     angle,
+    cosine_similarity,
+    clamped_cosine,
+    vector_map,
+    vector_addition,
+    vector_subtraction,
+    vector_elementwise_multiplication,
+    vector_scale,
 )
 
 
@@ -30,6 +39,36 @@ def test_angle():
     assert pytest.approx(angle([4, 0], [4, 0]), 0.1) == 0.0
     assert pytest.approx(angle([-2, 0], [2, 0]), 0.1) == 180.0
 
+    # Rounding must not push the cosine outside [-1, 1]
+    v = [6.888, 5.159, -1.589]
+    assert dot_product(v, v) / vector_length(v) ** 2 > 1.0  # unclamped cosine
+    assert angle(v, v) == 0.0
+    assert angle(v, [-x for x in v]) == 180.0
+
+    # Test case for a zero vector
+    with pytest.raises(ValueError):
+        angle([0, 0], [1, 0])
+
+    # Test case for mismatched vector sizes
+    with pytest.raises(ValueError):
+        angle([1, 3], [1, 2, 3])
+
+
+def test_cosine_similarity():
+    assert cosine_similarity([1, 0], [0, 3]) == pytest.approx(0.0)
+    assert cosine_similarity([3, 4], [6, 8]) == pytest.approx(1.0)
+    assert cosine_similarity([1, 1], [-2, -2]) == pytest.approx(-1.0)
+    v = [6.888, 5.159, -1.589]
+    assert cosine_similarity(v, v) == 1.0
+    assert cosine_similarity(v, [-x for x in v]) == -1.0
+
+    assert clamped_cosine(1.0000001, 1.0, 1.0) == 1.0
+    assert clamped_cosine(-1.0000001, 1.0, 1.0) == -1.0
+    assert clamped_cosine(3.0, 2.0, 3.0) == 0.5
+
+    # Similarity with a zero vector is 0
+    assert cosine_similarity([0, 0], [1, 2]) == 0.0
+
 
 def test_vector_length():
     assert vector_length([8, 15]) == pytest.approx(17.0)
@@ -38,3 +77,17 @@ def test_vector_length():
 
     # Test case for a vector with negative components
     assert vector_length([-12, -5]) == pytest.approx(13.0)
+
+
+def test_elementwise_operations():
+    assert vector_addition([1, 2, 3], [3, 2, 1]) == [4, 4, 4]
+    assert vector_addition([1, 2, 3], 1) == [2, 3, 4]
+    assert vector_addition([1, 2], Decimal(1)) == [Decimal(2), Decimal(3)]
+    assert vector_subtraction([1, 2, 3], [3, 2, 1]) == [-2, 0, 2]
+    assert vector_elementwise_multiplication([1, 2, 3], [3, 2, 1]) == [3, 4, 3]
+    assert vector_scale([1, -2], 3) == [3, -6]
+    assert vector_map(lambda x, y, z: x * y + z, [1, 2], [3, 4], 1) == [4, 9]
+
+    # Test case for mismatched vector sizes
+    with pytest.raises(ValueError):
+        vector_addition([1, 2], [1, 2, 3])
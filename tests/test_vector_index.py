@@ -0,0 +1,82 @@
+import random
+
+import pytest
+from project.vector import angle
+from project.vector_index import AngleIndex
+
+
+def random_vectors(rng, n, dim):
+    return [[rng.gauss(0.0, 1.0) for _ in range(dim)] for _ in range(n)]
+
+
+def test_query_stored_vector():
+    """
+    Test that a stored vector is found as its own nearest neighbour.
+    """
+    rng = random.Random(0)
+    vectors = random_vectors(rng, 100, 8)
+    index = AngleIndex(8, seed=1)
+    index.extend(vectors)
+    assert len(index) == 100
+
+    for i, v in enumerate(vectors):
+        idx, theta = index.query(v)[0]
+        assert idx == i
+        assert theta == pytest.approx(0.0, abs=1e-4)
+
+
+def test_query_matches_exact_angles():
+    """
+    Test that results are sorted and their angles are exact.
+    """
+    rng = random.Random(1)
+    vectors = random_vectors(rng, 200, 6)
+    index = AngleIndex(6, n_tables=4, n_bits=4, seed=2)
+    index.extend(vectors)
+
+    query = random_vectors(rng, 1, 6)[0]
+    result = index.query(query, k=5, probes=2)
+    assert 0 < len(result) <= 5
+    angles = [theta for _, theta in result]
+    assert angles == sorted(angles)
+    for idx, theta in result:
+        assert theta == pytest.approx(angle(query, vectors[idx]))
+
+
+def test_recall():
+    """
+    Test that slightly perturbed vectors find the original one.
+    """
+    rng = random.Random(2)
+    vectors = random_vectors(rng, 300, 16)
+    index = AngleIndex(16, n_tables=8, n_bits=6, seed=3)
+    index.extend(vectors)
+
+    hits = 0
+    for i, v in enumerate(vectors[:50]):
+        query = [x + rng.gauss(0.0, 0.05) for x in v]
+        result = index.query(query, probes=2)
+        hits += bool(result) and result[0][0] == i
+    assert hits >= 45
+
+
+def test_errors():
+    """
+    Test handling of invalid parameters and vectors.
+    """
+    with pytest.raises(ValueError):
+        AngleIndex(0)
+    index = AngleIndex(2)
+    with pytest.raises(ValueError):
+        index.add([1, 2, 3])
+    with pytest.raises(ValueError):
+        index.add([0, 0])
+    with pytest.raises(ValueError):
+        index.query([0, 0])
+    with pytest.raises(ValueError):
+        index.query([1, 0], k=0)
+    with pytest.raises(ValueError):
+        index.query([1, 0], k=-1)
+    with pytest.raises(ValueError):
+        index.query([1, 0], probes=-1)
+    assert index.query([1, 0]) == []